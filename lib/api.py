@@ -120,6 +120,21 @@ class MemoryBox:
 
         return self._client.add_command(cmd)
 
+    def add_commands(self, commands: list[Command]) -> list[str]:
+        """Add several commands to memory in one database round trip.
+
+        Args:
+            commands: Command model objects to store
+
+        Returns:
+            Command IDs, in the same order as the input
+
+        Example:
+            >>> mb.add_commands([Command(command="ls", description="List files")])
+            ['abc-123']
+        """
+        return self._client.add_commands(commands)
+
     def search_commands(
         self,
         query: str | None = None,
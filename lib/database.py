@@ -1,17 +1,43 @@
 """Neo4j database client for Memory Box."""
 
+import atexit
 import contextlib
+import functools
+import heapq
+import itertools
 import re
-import uuid
-from datetime import datetime
-
-from neo4j import Driver, GraphDatabase
+import secrets
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, datetime
+
+from neo4j import Driver, GraphDatabase, ManagedTransaction, Record, Session
+from neo4j.exceptions import DriverError, Neo4jError
 from neo4j.time import DateTime as Neo4jDateTime
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from lib.config import Settings
 from lib.models import Command, CommandWithMetadata
 
+# Maximum number of commands kept in memory between lookups
+COMMAND_CACHE_SIZE = 1024
+
+# Seconds a cached command is served from memory before it is refetched, so
+# uses and deletes by other processes become visible
+COMMAND_CACHE_TTL = 60.0
+
+# Maximum number of commands whose lowercased search text is kept in memory
+SEARCH_TEXT_CACHE_SIZE = 10_000
+
+# Seconds before tag/category listings are refetched, so writes made by other
+# processes (CLI, MCP server, bridge) become visible
+LISTING_CACHE_TTL = 60.0
+
+# Seconds between background writes of accumulated use counts
+USE_COUNT_FLUSH_INTERVAL = 5.0
+
 
 def _convert_neo4j_datetime(value: datetime | Neo4jDateTime | None) -> datetime | None:
     """Convert Neo4j DateTime to Python datetime."""
@@ -20,37 +46,213 @@ def _convert_neo4j_datetime(value: datetime | Neo4jDateTime | None) -> datetime
     return value
 
 
+# Scalar projection of a command and its collected tags; _record_to_command
+# unpacks the columns in this order
+_COMMAND_RETURN = """
+RETURN c.id AS id, c.command AS command, c.description AS description,
+       c.os AS os, c.project_type AS project_type, c.context AS context,
+       c.category AS category, c.created_at AS created_at,
+       c.last_used AS last_used, coalesce(c.use_count, 0) AS use_count, tags
+"""
+
+
+def _record_to_command(record: Record) -> CommandWithMetadata | None:
+    """Build a command from a ``_COMMAND_RETURN`` record, or None if its timestamp is invalid."""
+    (
+        command_id,
+        command,
+        description,
+        os,
+        project_type,
+        context,
+        category,
+        created_at,
+        last_used,
+        use_count,
+        tags,
+    ) = record
+
+    created_at = _convert_neo4j_datetime(created_at)
+    if created_at is None:
+        return None
+
+    # Command is already obfuscated in DB, just return it
+    return CommandWithMetadata(
+        id=command_id,
+        command=command,
+        description=description,
+        tags=tags,
+        os=os,
+        project_type=project_type,
+        context=context,
+        category=category,
+        created_at=created_at,
+        last_used=_convert_neo4j_datetime(last_used),
+        use_count=use_count,
+    )
+
+
+# Secret values may be double-quoted, single-quoted, or unquoted
+_MASKED_VALUE = r"""(?:"[^"]*"|'[^']*'|\S+)"""
+_MASKED_KEYS = (
+    r"password|pwd|pass|token|api_key|apikey|secret|"
+    r"NEO4J_PASSWORD|DB_PASSWORD|POSTGRES_PASSWORD"
+)
+
+# All secret shapes fused into one alternation so a command is scanned once
+_SECRET_PATTERN = re.compile(
+    # Flags like -p, --password followed by a value
+    rf"(?P<flag>-p|--password|--pass|--pwd)\s+{_MASKED_VALUE}"
+    # Key=value parameters and environment variables
+    rf"|(?P<key>(?:{_MASKED_KEYS})=){_MASKED_VALUE}"
+    # Passwords in URL credentials (user:password@host)
+    r"|(?P<url>://[^:\s]+:)[^@\s]+(?=@)",
+    re.IGNORECASE,
+)
+
+
+def _mask_secret(match: re.Match[str]) -> str:
+    """Replace the secret part of a match, keeping its flag, key or URL prefix."""
+    if match["flag"] is not None:
+        return f"{match['flag']} ****"
+    return f"{match['key'] or match['url']}****"
+
+
 def _obfuscate_secrets(command: str) -> str:
     """Obfuscate passwords and secrets in commands."""
-    # Pattern for common password/token flags and parameters
-    # Supports quoted values (single or double quotes) and unquoted values
-    patterns = [
-        # Flags like -p, --password followed by quoted values (with any content inside)
-        (r'''(-p|--password|--pass|--pwd)\s+"[^"]*"''', r"\1 ****"),
-        (r"""(-p|--password|--pass|--pwd)\s+'[^']*'""", r"\1 ****"),
-        # Flags followed by unquoted values
-        (r"(-p|--password|--pass|--pwd)\s+\S+", r"\1 ****"),
-        # Key=value with double quotes
-        (r'''(password=|pwd=|pass=)"[^"]*"''', r"\1****"),
-        (r'''(token=|api_key=|apikey=|secret=)"[^"]*"''', r"\1****"),
-        (r'''(NEO4J_PASSWORD=|DB_PASSWORD=|POSTGRES_PASSWORD=)"[^"]*"''', r"\1****"),
-        # Key=value with single quotes
-        (r"""(password=|pwd=|pass=)'[^']*'""", r"\1****"),
-        (r"""(token=|api_key=|apikey=|secret=)'[^']*'""", r"\1****"),
-        (r"""(NEO4J_PASSWORD=|DB_PASSWORD=|POSTGRES_PASSWORD=)'[^']*'""", r"\1****"),
-        # Key=value without quotes
-        (r"(password=|pwd=|pass=)\S+", r"\1****"),
-        (r"(token=|api_key=|apikey=|secret=)\S+", r"\1****"),
-        (r"(NEO4J_PASSWORD=|DB_PASSWORD=|POSTGRES_PASSWORD=)\S+", r"\1****"),
-        # Match passwords in URLs
-        (r"(://[^:]+:)([^@]+)(@)", r"\1****\3"),
-    ]
-
-    obfuscated = command
-    for pattern, replacement in patterns:
-        obfuscated = re.sub(pattern, replacement, obfuscated, flags=re.IGNORECASE)
-
-    return obfuscated.rstrip()
+    return _SECRET_PATTERN.sub(_mask_secret, command).rstrip()
+
+
+def _run_query(tx: ManagedTransaction, query: str, params: dict[str, object]) -> list[Record]:
+    """Run a query inside a managed transaction and materialize its records."""
+    return list(tx.run(query, params))
+
+
+def _command_row(command_id: str, command: Command, created_at: datetime) -> dict[str, object]:
+    """Build the query parameters for storing a new command."""
+    return {
+        "id": command_id,
+        # Always strip secrets from command before storing
+        "command": _obfuscate_secrets(command.command),
+        "description": command.description,
+        "os": command.os,
+        "project_type": command.project_type,
+        "context": command.context,
+        "category": command.category,
+        # Duplicate tags would only repeat the same MERGE lookups
+        "tags": list(dict.fromkeys(command.tags)),
+        "created_at": created_at,
+    }
+
+
+# Batch insert for rows built by _command_row; _TAG_COMMANDS is appended only
+# when at least one row carries tags
+_CREATE_COMMANDS = """
+    UNWIND $rows AS row
+    CREATE (c:Command {
+        id: row.id,
+        command: row.command,
+        description: row.description,
+        os: row.os,
+        project_type: row.project_type,
+        context: row.context,
+        category: row.category,
+        created_at: row.created_at,
+        last_used: NULL,
+        use_count: 0
+    })
+"""
+
+_TAG_COMMANDS = """
+    WITH c, row
+    UNWIND row.tags AS tag
+    MERGE (t:Tag {name: tag})
+    MERGE (c)-[:TAGGED_WITH]->(t)
+"""
+
+
+def _copy_for_caller(command: CommandWithMetadata) -> CommandWithMetadata:
+    """Copy a cached command so the caller can't mutate the cached tags list."""
+    return command.model_copy(update={"tags": list(command.tags)})
+
+
+def _iter_commands(records: Iterable[Record]) -> Iterator[CommandWithMetadata]:
+    """Lazily build commands from records, skipping those with invalid timestamps."""
+    for record in records:
+        command = _record_to_command(record)
+        if command is not None:
+            yield command
+
+
+@functools.lru_cache(maxsize=64)
+def _build_search_cypher(
+    *,
+    has_query: bool,
+    has_os: bool,
+    has_project_type: bool,
+    has_category: bool,
+    has_tags: bool,
+) -> str:
+    """Build the command search query for a combination of active filters.
+
+    Cached so each combination yields one stable query string, which keeps
+    Neo4j's query plan cache warm and skips rebuilding the text per search.
+    """
+    where_clauses = []
+
+    # Text search (only for exact matching, not fuzzy)
+    if has_query:
+        where_clauses.append(
+            "(c.command CONTAINS $query OR c.description CONTAINS $query OR "
+            "c.context CONTAINS $query)"
+        )
+
+    # Structural filters
+    if has_os:
+        where_clauses.append("c.os = $os")
+    if has_project_type:
+        where_clauses.append("c.project_type = $project_type")
+    if has_category:
+        where_clauses.append("c.category = $category")
+
+    # Tag matching
+    tag_match = ""
+    if has_tags:
+        tag_match = """
+        MATCH (c)-[:TAGGED_WITH]->(t:Tag)
+        WHERE t.name IN $tags
+        WITH c, count(t) as tag_count
+        WHERE tag_count = size($tags)
+        """
+
+    # Build WHERE clause
+    where_clause = ""
+    if where_clauses:
+        if tag_match:
+            where_clause = "WITH c\nWHERE " + " AND ".join(where_clauses)
+        else:
+            where_clause = "WHERE " + " AND ".join(where_clauses)
+
+    return f"""
+    MATCH (c:Command)
+    {tag_match}
+    {where_clause}
+    OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
+    WITH c, collect(t.name) as tags
+    ORDER BY c.use_count DESC, c.created_at DESC
+    {_COMMAND_RETURN}
+    """
+
+
+class _ThreadSession:
+    """A thread's session, closed automatically once the thread has exited."""
+
+    __slots__ = ("__weakref__", "close", "session")
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        # Runs when the owning thread's local storage is released, or on client close
+        self.close = weakref.finalize(self, session.close)
 
 
 class Neo4jClient:
@@ -62,72 +264,137 @@ class Neo4jClient:
             settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password)
         )
         self.database = settings.neo4j_database
+        # Sessions are not thread-safe, so each thread reuses its own; sharing one
+        # bookmark manager lets a read on any thread observe writes from the others
+        self._bookmark_manager = GraphDatabase.bookmark_manager()
+        self._local = threading.local()
+        self._sessions: weakref.WeakSet[_ThreadSession] = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._command_cache: dict[str, tuple[float, CommandWithMetadata]] = {}
+        self._listing_cache: dict[str, tuple[float, list[str]]] = {}
+        self._search_text_cache: dict[str, tuple[str, str, str]] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped whenever cached entries are invalidated, so fetches that started
+        # earlier don't cache stale results
+        self._cache_generation = 0
+        # Use counts are accumulated in memory and written in batches
+        self._pending_counts: dict[str, int] = {}
+        self._pending_last_used: dict[str, datetime] = {}
+        self._usage_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Commands being written by the current flush, and a count of flushes started,
+        # so lookups can tell whether a read raced a flush
+        self._flushing: set[str] = set()
+        self._flush_epoch = 0
+        self._flush_finished = threading.Condition(self._usage_lock)
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
         self._initialize_constraints()
 
     def close(self) -> None:
-        """Close the database connection."""
-        self.driver.close()
+        """Close the database connection, writing any pending use counts first."""
+        atexit.unregister(self._close_at_exit)
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+        try:
+            self._flush_use_counts()
+        finally:
+            with self._sessions_lock:
+                thread_sessions = list(self._sessions)
+                self._sessions.clear()
+            for thread_session in thread_sessions:
+                thread_session.close()
+            self.driver.close()
+
+    def _get_session(self) -> Session:
+        """Get the calling thread's session, creating it on first use.
+
+        Worker threads come and go (e.g. the MCP server's thread pool), so a
+        session is closed and forgotten once the thread that owns it exits.
+        """
+        thread_session: _ThreadSession | None = getattr(self._local, "session", None)
+        if thread_session is None:
+            thread_session = _ThreadSession(
+                self.driver.session(database=self.database, bookmark_manager=self._bookmark_manager)
+            )
+            self._local.session = thread_session
+            with self._sessions_lock:
+                self._sessions.add(thread_session)
+        return thread_session.session
+
+    def _execute_read(self, query: str, /, **params: object) -> list[Record]:
+        """Run a read query on the calling thread's session."""
+        return self._get_session().execute_read(_run_query, query, params)
+
+    def _execute_write(self, query: str, /, **params: object) -> list[Record]:
+        """Run a write query on the calling thread's session."""
+        return self._get_session().execute_write(_run_query, query, params)
 
     def _initialize_constraints(self) -> None:
         """Create necessary constraints and indexes."""
-        with self.driver.session(database=self.database) as session:
+        # A short-lived session whose results are all consumed, so no connection or
+        # deferred error is left on the constructing thread's reusable session
+        with self.driver.session(
+            database=self.database, bookmark_manager=self._bookmark_manager
+        ) as session:
             # Ensure unique IDs for commands
             session.run(
                 "CREATE CONSTRAINT command_id_unique IF NOT EXISTS "
                 "FOR (c:Command) REQUIRE c.id IS UNIQUE"
-            )
+            ).consume()
+            # Unique tag names let MERGE (t:Tag {name: ...}) use an index seek
+            with contextlib.suppress(Neo4jError):
+                # Duplicate tags left by concurrent MERGEs block the constraint; the
+                # client still works without it, just with slower tag lookups. The
+                # failure only arrives with the result, so it is consumed here.
+                session.run(
+                    "CREATE CONSTRAINT tag_name_unique IF NOT EXISTS "
+                    "FOR (t:Tag) REQUIRE t.name IS UNIQUE"
+                ).consume()
             # Index for faster text search
             session.run(
                 "CREATE INDEX command_text_index IF NOT EXISTS "
                 "FOR (c:Command) ON (c.command, c.description)"
-            )
+            ).consume()
             # Full-text index for fuzzy search
             with contextlib.suppress(Exception):
                 # Index might already exist or Neo4j version doesn't support it
                 session.run(
                     "CREATE FULLTEXT INDEX command_fulltext IF NOT EXISTS "
                     "FOR (c:Command) ON EACH [c.command, c.description, c.context]"
-                )
+                ).consume()
 
     def add_command(self, command: Command) -> str:
         """Add a new command to the database."""
-        command_id = str(uuid.uuid4())
+        return self.add_commands([command])[0]
 
-        # Always strip secrets from command before storing
-        command_text = _obfuscate_secrets(command.command)
+    def add_commands(self, commands: list[Command]) -> list[str]:
+        """Add several commands to the database in a single transaction.
 
-        with self.driver.session(database=self.database) as session:
-            session.run(
-                """
-                CREATE (c:Command {
-                    id: $id,
-                    command: $command,
-                    description: $description,
-                    os: $os,
-                    project_type: $project_type,
-                    context: $context,
-                    category: $category,
-                    created_at: datetime($created_at),
-                    last_used: NULL,
-                    use_count: 0
-                })
-                WITH c
-                UNWIND $tags AS tag
-                MERGE (t:Tag {name: tag})
-                MERGE (c)-[:TAGGED_WITH]->(t)
-                """,
-                id=command_id,
-                command=command_text,
-                description=command.description,
-                os=command.os,
-                project_type=command.project_type,
-                context=command.context,
-                category=command.category,
-                tags=command.tags,
-                created_at=datetime.now().astimezone().isoformat(),
-            )
+        Returns:
+            The new command IDs, in the same order as ``commands``
+        """
+        if not commands:
+            return []
+
+        command_ids = [secrets.token_hex(16) for _ in commands]
+        # Native datetimes travel as Bolt DateTime values, so Neo4j needs no parsing
+        created_at = datetime.now(UTC)
+        rows = [
+            _command_row(command_id, command, created_at)
+            for command_id, command in zip(command_ids, commands, strict=True)
+        ]
+
+        # Skip the tag MERGE half entirely when no command in the batch has tags
+        has_tags = any(row["tags"] for row in rows)
+        self._execute_write(
+            _CREATE_COMMANDS + _TAG_COMMANDS if has_tags else _CREATE_COMMANDS,
+            rows=rows,
+        )
+        self._invalidate_listings()
 
-        return command_id
+        return command_ids
 
     def search_commands(
         self,
@@ -152,7 +419,14 @@ class Neo4jClient:
             fuzzy: Enable fuzzy matching for query
             fuzzy_threshold: Minimum similarity score (0-100) for fuzzy matches
         """
-        # Fetch candidates from database with structural filters only
+        # Make sure ordering by use_count sees every recorded use
+        self._flush_use_counts()
+
+        # Fetch candidates from database with structural filters only.
+        # Fuzzy scoring stays client-side: the command_fulltext index's Lucene
+        # edit-distance terms can't honour partial_ratio or fuzzy_threshold,
+        # and a CONTAINS prefilter on a query trigram would drop typos that
+        # share no exact trigram with the command (e.g. "doker", "gerp").
         candidates = self._fetch_command_candidates(
             os=os,
             project_type=project_type,
@@ -162,13 +436,11 @@ class Neo4jClient:
         )
 
         # Apply text matching (exact or fuzzy)
-        if query:
-            if fuzzy:
-                return self._apply_fuzzy_matching(candidates, query, fuzzy_threshold, limit)
-            # Exact match already filtered in query, just limit
-            return candidates[:limit]
+        if query and fuzzy:
+            return self._apply_fuzzy_matching(list(candidates), query, fuzzy_threshold, limit)
 
-        return candidates[:limit]
+        # Exact match already filtered in query, so only build the first `limit` commands
+        return list(itertools.islice(candidates, limit))
 
     def _fetch_command_candidates(
         self,
@@ -177,96 +449,33 @@ class Neo4jClient:
         category: str | None = None,
         tags: list[str] | None = None,
         query: str | None = None,
-    ) -> list[CommandWithMetadata]:
+    ) -> Iterator[CommandWithMetadata]:
         """Fetch command candidates from database with structural filters.
 
         This method handles all database-level filtering (OS, project type,
         category, tags, and optional exact text matching). Text matching
         is only applied here for exact searches, not fuzzy searches.
+        Commands are built lazily as the returned iterator is consumed.
         """
-        where_clauses = []
-        params: dict[str, str | list[str]] = {}
-
-        # Text search (only for exact matching, not fuzzy)
-        if query:
-            where_clauses.append(
-                "(c.command CONTAINS $query OR c.description CONTAINS $query OR "
-                "c.context CONTAINS $query)"
-            )
-            params["query"] = query
-
-        # Structural filters
-        if os:
-            where_clauses.append("c.os = $os")
-            params["os"] = os
-
-        if project_type:
-            where_clauses.append("c.project_type = $project_type")
-            params["project_type"] = project_type
-
-        if category:
-            where_clauses.append("c.category = $category")
-            params["category"] = category
-
-        # Tag matching
-        tag_match = ""
-        if tags:
-            tag_match = """
-            MATCH (c)-[:TAGGED_WITH]->(t:Tag)
-            WHERE t.name IN $tags
-            WITH c, count(t) as tag_count
-            WHERE tag_count = size($tags)
-            """
-            params["tags"] = list(tags)
-
-        # Build WHERE clause
-        where_clause = ""
-        if where_clauses:
-            if tag_match:
-                where_clause = "WITH c\nWHERE " + " AND ".join(where_clauses)
-            else:
-                where_clause = "WHERE " + " AND ".join(where_clauses)
-
-        # Build and execute query
-        cypher_query = f"""
-        MATCH (c:Command)
-        {tag_match}
-        {where_clause}
-        OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
-        WITH c, collect(t.name) as tags
-        ORDER BY c.use_count DESC, c.created_at DESC
-        RETURN c, tags
-        """
-
-        with self.driver.session(database=self.database) as session:
-            result = session.run(cypher_query, params)
-            commands = []
-
-            for record in result:
-                node = record["c"]
-                tags = record["tags"]
-
-                created_at = _convert_neo4j_datetime(node["created_at"])
-                if created_at is None:
-                    continue  # Skip records with invalid timestamps
-
-                commands.append(
-                    CommandWithMetadata(
-                        id=node["id"],
-                        command=node["command"],
-                        description=node["description"],
-                        tags=tags,
-                        os=node.get("os"),
-                        project_type=node.get("project_type"),
-                        context=node.get("context"),
-                        category=node.get("category"),
-                        created_at=created_at,
-                        last_used=_convert_neo4j_datetime(node.get("last_used")),
-                        use_count=node.get("use_count", 0),
-                    )
-                )
+        # Only truthy filters become parameters, matching the clauses in the query
+        filters: dict[str, str | list[str] | None] = {
+            "query": query,  # Text search (only for exact matching, not fuzzy)
+            "os": os,
+            "project_type": project_type,
+            "category": category,
+            # Deduplicated so the tag_count = size($tags) check can be satisfied
+            "tags": list(dict.fromkeys(tags)) if tags else None,
+        }
+        params = {name: value for name, value in filters.items() if value}
+        cypher_query = _build_search_cypher(
+            has_query="query" in params,
+            has_os="os" in params,
+            has_project_type="project_type" in params,
+            has_category="category" in params,
+            has_tags="tags" in params,
+        )
 
-            return commands
+        return _iter_commands(self._execute_read(cypher_query, **params))
 
     def _apply_fuzzy_matching(
         self, candidates: list[CommandWithMetadata], query: str, threshold: int, limit: int
@@ -276,110 +485,291 @@ class Neo4jClient:
         This method scores all candidates using fuzzy string matching,
         filters by threshold, and returns the top matches sorted by score.
         """
-        scored_commands = []
         query_lower = query.lower()
+        best_scores = [0.0] * len(candidates)
+
+        # Score against command, description, and context, each in one batched call.
+        # There is deliberately no character-set prefilter: typos mean a match can
+        # lack query characters, and score_cutoff already rejects cheaply in C.
+        for choices in zip(*self._get_search_texts(candidates), strict=True):
+            for _, score, index in process.extract(
+                query_lower, choices, scorer=fuzz.partial_ratio, limit=None, score_cutoff=threshold
+            ):
+                best_scores[index] = max(best_scores[index], score)
+
+        scored_commands = (
+            (score, cmd)
+            for score, cmd in zip(best_scores, candidates, strict=True)
+            if score >= threshold
+        )
 
-        for cmd in candidates:
-            # Score against command, description, and context
-            cmd_score = fuzz.partial_ratio(query_lower, cmd.command.lower())
-            desc_score = fuzz.partial_ratio(query_lower, cmd.description.lower())
-            ctx_score = fuzz.partial_ratio(query_lower, (cmd.context or "").lower())
-            max_score = max(cmd_score, desc_score, ctx_score)
+        # Top matches by score (highest first), then by use count
+        top_matches = heapq.nlargest(limit, scored_commands, key=lambda x: (x[0], x[1].use_count))
 
-            if max_score >= threshold:
-                scored_commands.append((max_score, cmd))
+        return [cmd for _, cmd in top_matches]
 
-        # Sort by score (highest first), then by use count
-        scored_commands.sort(key=lambda x: (-x[0], -x[1].use_count))
+    def _get_search_texts(
+        self, candidates: list[CommandWithMetadata]
+    ) -> list[tuple[str, str, str]]:
+        """Get each candidate's lowercased command, description and context.
 
-        return [cmd for _, cmd in scored_commands[:limit]]
+        Commands are immutable once stored, so the text is cached by ID across searches.
+        Candidate sets larger than the cache are not added to it, as they would only
+        evict entries they are about to need again.
+        """
+        with self._cache_lock:
+            cached = [self._search_text_cache.get(cmd.id) for cmd in candidates]
+
+        texts = []
+        missing = {}
+        for cmd, cached_text in zip(candidates, cached, strict=True):
+            text = cached_text
+            if text is None:
+                text = (cmd.command.lower(), cmd.description.lower(), (cmd.context or "").lower())
+                missing[cmd.id] = text
+            texts.append(text)
+
+        if missing and len(candidates) <= SEARCH_TEXT_CACHE_SIZE:
+            with self._cache_lock:
+                cache = self._search_text_cache
+                # Evict the oldest entries to make room, in a single pass over the cache
+                overflow = len(cache) + len(missing) - SEARCH_TEXT_CACHE_SIZE
+                for command_id in list(itertools.islice(cache, max(overflow, 0))):
+                    del cache[command_id]
+                cache.update(missing)
+
+        return texts
 
     def get_command(self, command_id: str) -> CommandWithMetadata | None:
         """Get a specific command by ID and increment its use count."""
+        now = datetime.now(UTC)
+        with self._usage_lock:
+            command = self._use_cached_command(command_id, now)
+        if command is not None:
+            return command
+
+        while True:
+            with self._usage_lock:
+                # A read straddling the commit of a flush of this command could count
+                # those uses twice or not at all, so that flush is waited out
+                while command_id in self._flushing:
+                    self._flush_finished.wait()
+                flush_epoch = self._flush_epoch
+            with self._cache_lock:
+                cache_generation = self._cache_generation
+
+            # The read happens outside the lock so lookups don't queue behind each other
+            fetched = self._fetch_command(command_id)
+            if fetched is None:
+                self._evict_command(command_id)  # Deleted elsewhere
+                return None
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(
-                """
-                MATCH (c:Command {id: $id})
-                SET c.use_count = c.use_count + 1,
-                    c.last_used = datetime($now)
-                WITH c
-                OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
-                WITH c, collect(t.name) as tags
-                RETURN c, tags
-                """,
-                id=command_id,
-                now=datetime.now().astimezone().isoformat(),
+            with self._usage_lock:
+                if self._flush_epoch != flush_epoch:
+                    continue  # A flush started during the read and may or may not be in it
+                self._record_use(command_id, now)
+                # Stored count plus every use not yet flushed, including this one
+                use_count = fetched.use_count + self._pending_counts[command_id]
+                command = fetched.model_copy(update={"use_count": use_count, "last_used": now})
+                self._cache_command(command, time.monotonic() + COMMAND_CACHE_TTL, cache_generation)
+            return _copy_for_caller(command)
+
+    def _use_cached_command(self, command_id: str, now: datetime) -> CommandWithMetadata | None:
+        """Record a use of a command from its fresh cached copy, if there is one.
+
+        A cached copy already counts every use made through this client, so only
+        uses and deletes by other processes wait for the entry to expire.
+        Must be called with ``_usage_lock`` held.
+        """
+        with self._cache_lock:
+            entry = self._command_cache.get(command_id)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            expires_at, cached = entry
+            command = cached.model_copy(
+                update={"use_count": cached.use_count + 1, "last_used": now}
             )
+            self._command_cache[command_id] = (expires_at, command)
+        self._record_use(command_id, now)
+        return _copy_for_caller(command)
 
-            record = result.single()
-            if not record:
-                return None
+    def _fetch_command(self, command_id: str) -> CommandWithMetadata | None:
+        """Fetch a full command by ID."""
+        records = self._execute_read(
+            """
+            MATCH (c:Command {id: $id})
+            OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
+            WITH c, collect(t.name) as tags
+            """
+            + _COMMAND_RETURN,
+            id=command_id,
+        )
+        return _record_to_command(records[0]) if records else None
 
-            node = record["c"]
-            tags = record["tags"]
-
-            # Validate timestamp before creating command object
-            created_at = _convert_neo4j_datetime(node["created_at"])
-            if created_at is None:
-                return None  # Invalid timestamp
-
-            # Command is already obfuscated in DB, just return it
-            return CommandWithMetadata(
-                id=node["id"],
-                command=node["command"],
-                description=node["description"],
-                tags=tags,
-                os=node.get("os"),
-                project_type=node.get("project_type"),
-                context=node.get("context"),
-                category=node.get("category"),
-                created_at=created_at,
-                last_used=_convert_neo4j_datetime(node.get("last_used")),
-                use_count=node.get("use_count", 0),
-            )
+    def _record_use(self, command_id: str, now: datetime) -> None:
+        """Queue a use count increment.
 
-    def delete_command(self, command_id: str) -> bool:
-        """Delete a command from the database."""
+        Must be called with ``_usage_lock`` held.
+        """
+        self._pending_counts[command_id] = self._pending_counts.get(command_id, 0) + 1
+        self._pending_last_used[command_id] = now
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(
-                """
-                MATCH (c:Command {id: $id})
-                DETACH DELETE c
-                RETURN count(c) as deleted
-                """,
-                id=command_id,
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically, name="memory-box-use-counts", daemon=True
             )
+            self._flush_thread.start()
+            # The flush thread is a daemon, so clients that are never closed (like the
+            # MCP server's) still write their queued counts when the interpreter exits
+            atexit.register(self._close_at_exit)
+
+    def _close_at_exit(self) -> None:
+        """Close the client at interpreter exit, giving up on counts that can't be written."""
+        with contextlib.suppress(DriverError, Neo4jError):
+            self.close()
+
+    def _flush_periodically(self) -> None:
+        """Flush pending use counts until the client is closed."""
+        while not self._flush_stop.wait(USE_COUNT_FLUSH_INTERVAL):
+            # Counts stay queued on failure and are retried next interval
+            with contextlib.suppress(DriverError, Neo4jError):
+                self._flush_use_counts()
+
+    def _flush_use_counts(self) -> None:
+        """Write all pending use counts to the database in one transaction.
+
+        Lookups keep queuing uses meanwhile; only other flushes, and cache misses for
+        a command being written, wait for it. The flushed counts are subtracted
+        once the write has committed.
+        """
+        with self._flush_lock:
+            with self._usage_lock:
+                flushed = dict(self._pending_counts)
+                if not flushed:
+                    return
+                updates = [
+                    {
+                        "id": command_id,
+                        "count": count,
+                        "last_used": self._pending_last_used[command_id],
+                    }
+                    for command_id, count in flushed.items()
+                ]
+                self._flushing = set(flushed)
+                self._flush_epoch += 1
+
+            written: dict[str, int] = {}
+            try:
+                self._execute_write(
+                    """
+                    UNWIND $updates AS update
+                    MATCH (c:Command {id: update.id})
+                    SET c.use_count = coalesce(c.use_count, 0) + update.count,
+                        c.last_used = update.last_used
+                    """,
+                    updates=updates,
+                )
+                written = flushed
+            finally:
+                self._finish_flush(written)
+
+    def _finish_flush(self, written: dict[str, int]) -> None:
+        """Drop written counts from the queue and wake lookups waiting on the flush."""
+        with self._usage_lock:
+            for command_id, count in written.items():
+                remaining = self._pending_counts[command_id] - count
+                if remaining:
+                    self._pending_counts[command_id] = remaining
+                else:
+                    del self._pending_counts[command_id]
+                    del self._pending_last_used[command_id]
+            self._flushing = set()
+            self._flush_finished.notify_all()
+
+    def _cache_command(
+        self, command: CommandWithMetadata, expires_at: float, generation: int
+    ) -> None:
+        """Remember a command until ``expires_at``, evicting the oldest entry when full.
+
+        Nothing is stored if the cache was invalidated since ``generation`` was read,
+        as the command may have been fetched before a delete.
+        """
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            self._command_cache.pop(command.id, None)
+            if len(self._command_cache) >= COMMAND_CACHE_SIZE:
+                del self._command_cache[next(iter(self._command_cache))]
+            self._command_cache[command.id] = (expires_at, command)
+
+    def _evict_command(self, command_id: str) -> None:
+        """Forget a cached command."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._command_cache.pop(command_id, None)
+            self._search_text_cache.pop(command_id, None)
+
+    def _invalidate_listings(self) -> None:
+        """Drop cached tag and category listings after a write."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._listing_cache.clear()
+
+    def _cached_listing(self, key: str, fetch: Callable[[], list[str]]) -> list[str]:
+        """Return a cached listing, refetching it once it has expired."""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._listing_cache.get(key)
+            generation = self._cache_generation
+        if entry is None or entry[0] <= now:
+            entry = (now + LISTING_CACHE_TTL, fetch())
+            with self._cache_lock:
+                # A write since the fetch began may be missing from it
+                if generation == self._cache_generation:
+                    self._listing_cache[key] = entry
+        return list(entry[1])
 
-            record = result.single()
-            return record["deleted"] > 0 if record else False
+    def delete_command(self, command_id: str) -> bool:
+        """Delete a command from the database."""
+        records = self._execute_write(
+            """
+            MATCH (c:Command {id: $id})
+            DETACH DELETE c
+            RETURN count(c) as deleted
+            """,
+            id=command_id,
+        )
+        self._evict_command(command_id)
+        self._invalidate_listings()
+        return records[0]["deleted"] > 0 if records else False
 
     def get_all_tags(self) -> list[str]:
         """Get all unique tags in the database."""
+        return self._cached_listing("tags", self._fetch_all_tags)
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(
-                """
-                MATCH (t:Tag)
-                RETURN t.name as tag
-                ORDER BY tag
-                """
-            )
-
-            return [record["tag"] for record in result]
+    def _fetch_all_tags(self) -> list[str]:
+        """Load all unique tag names, sorted."""
+        records = self._execute_read(
+            """
+            MATCH (t:Tag)
+            RETURN t.name as tag
+            ORDER BY tag
+            """
+        )
+        return [record["tag"] for record in records]
 
     def get_all_categories(self) -> list[str]:
         """Get all unique categories in the database."""
+        return self._cached_listing("categories", self._fetch_all_categories)
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(
-                """
-                MATCH (c:Command)
-                WHERE c.category IS NOT NULL
-                RETURN DISTINCT c.category as category
-                ORDER BY category
-                """
-            )
-
-            return [record["category"] for record in result]
+    def _fetch_all_categories(self) -> list[str]:
+        """Load all unique categories, sorted."""
+        records = self._execute_read(
+            """
+            MATCH (c:Command)
+            WHERE c.category IS NOT NULL
+            RETURN DISTINCT c.category as category
+            ORDER BY category
+            """
+        )
+        return [record["category"] for record in records]
@@ -2,12 +2,15 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Command(BaseModel):
     """A command stored in the memory box."""
 
+    # Immutable so instances can be shared safely, e.g. from the client's command cache
+    model_config = ConfigDict(frozen=True)
+
     command: str = Field(..., description="The actual command or code snippet")
     description: str = Field(..., description="What this command does")
     tags: list[str] = Field(default_factory=list, description="Tags for categorization")
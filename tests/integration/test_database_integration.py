@@ -78,6 +78,25 @@ class TestNeo4jIntegration:
         assert retrieved.category == "git"
         assert retrieved.use_count == 1  # Incremented when retrieved
 
+    def test_add_commands_batch(self, db_client: Neo4jClient) -> None:
+        """Test adding several commands at once and retrieving each."""
+        commands = [
+            Command(command="git log", description="Show commit logs", tags=["git"]),
+            Command(command="docker ps", description="List containers", tags=["docker", "ps"]),
+            Command(command="ls -la", description="List files"),
+        ]
+
+        command_ids = db_client.add_commands(commands)
+        assert len(command_ids) == 3
+
+        for command_id, cmd in zip(command_ids, commands, strict=True):
+            retrieved = db_client.get_command(command_id)
+            assert retrieved is not None
+            assert retrieved.command == cmd.command
+            assert set(retrieved.tags) == set(cmd.tags)
+
+        assert db_client.get_all_tags() == ["docker", "git", "ps"]
+
     def test_search_commands_by_query(self, db_client: Neo4jClient) -> None:
         """Test searching commands by text query."""
         # Add multiple commands
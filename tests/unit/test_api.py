@@ -77,6 +77,24 @@ def test_add_command_with_command_object():
         mock_instance.add_command.assert_called_once_with(cmd)
 
 
+def test_add_commands():
+    """Test adding several Command objects at once."""
+    with patch("lib.api.Neo4jClient") as mock_client:
+        mock_instance = MagicMock()
+        mock_instance.add_commands.return_value = ["id-1", "id-2"]
+        mock_client.return_value = mock_instance
+
+        mb = MemoryBox()
+        cmds = [
+            Command(command="git status", description="Check status"),
+            Command(command="docker ps", description="List containers"),
+        ]
+        command_ids = mb.add_commands(cmds)
+
+        assert command_ids == ["id-1", "id-2"]
+        mock_instance.add_commands.assert_called_once_with(cmds)
+
+
 def test_add_command_with_all_parameters():
     """Test adding a command with all optional parameters."""
     with patch("lib.api.Neo4jClient") as mock_client:
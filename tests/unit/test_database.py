@@ -1,11 +1,16 @@
 """Tests for database module."""
 
-from unittest.mock import Mock, patch
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from neo4j import Record
+from neo4j.exceptions import Neo4jError
 
 from lib.config import Settings
-from lib.database import Neo4jClient
+from lib.database import COMMAND_CACHE_TTL, Neo4jClient
 from lib.models import Command, CommandWithMetadata
 
 
@@ -26,15 +31,54 @@ def mock_driver() -> Mock:
     return Mock()
 
 
+class FakeResult(list[object]):
+    """Records returned by a mocked ``run``, consumable like a driver result."""
+
+    def consume(self) -> None:
+        """Discard the records, as the driver does."""
+        self.clear()
+
+
 @pytest.fixture
 def mock_session() -> Mock:
     """Create a mock Neo4j session."""
     session = Mock()
     session.__enter__ = Mock(return_value=session)
     session.__exit__ = Mock(return_value=False)
+    # Tests set run.return_value to the records a query should produce
+    session.run.return_value = []
+    session.run.side_effect = lambda *args: FakeResult(session.run.return_value)
+    # Managed transactions run their work function against the session itself
+    session.execute_read.side_effect = lambda work, *args: work(session, *args)
+    session.execute_write.side_effect = lambda work, *args: work(session, *args)
     return session
 
 
+def make_command_record(
+    command_id: str,
+    command: str,
+    description: str,
+    tags: list[str] | None = None,
+    **fields: object,
+) -> Record:
+    """Create a record shaped like the client's command projection."""
+    values: dict[str, object] = {
+        "id": command_id,
+        "command": command,
+        "description": description,
+        "os": None,
+        "project_type": None,
+        "context": None,
+        "category": None,
+        "created_at": "2023-01-01T00:00:00",
+        "last_used": None,
+        "use_count": 0,
+        "tags": tags or [],
+    }
+    values.update(fields)
+    return Record(values)
+
+
 class TestNeo4jClient:
     """Tests for Neo4jClient class."""
 
@@ -57,6 +101,44 @@ class TestNeo4jClient:
         )
         assert client.database == "test_db"
 
+    @patch("lib.database.GraphDatabase")
+    def test_client_starts_without_tag_constraint(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test duplicate tags blocking the tag constraint don't stop the client starting."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+
+        # Like the driver, the failure surfaces on consume() or, left unconsumed,
+        # on the session's next query
+        unconsumed_errors: list[Neo4jError] = []
+
+        def run(query: str, *args: object) -> MagicMock:
+            if unconsumed_errors:
+                raise unconsumed_errors.pop()
+            result = MagicMock()
+            result.__iter__.return_value = iter([])
+            if "tag_name_unique" in query:
+                error = Neo4jError()
+                unconsumed_errors.append(error)
+
+                def consume() -> None:
+                    unconsumed_errors.remove(error)
+                    raise error
+
+                result.consume.side_effect = consume
+            return result
+
+        mock_session.run.side_effect = run
+
+        client = Neo4jClient(mock_settings)
+
+        assert client.get_all_tags() == []
+
     @patch("lib.database.GraphDatabase")
     def test_client_close(
         self,
@@ -70,24 +152,83 @@ class TestNeo4jClient:
         mock_driver.session.return_value = mock_session
 
         client = Neo4jClient(mock_settings)
+        # Schema setup uses its own session, closed straight away
+        mock_session.__exit__.assert_called_once()
+
+        client.get_all_tags()
         client.close()
 
         mock_driver.close.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    @patch("lib.database.GraphDatabase")
+    def test_client_reuses_session(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test that queries share one session instead of opening one per call."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = []
+
+        client = Neo4jClient(mock_settings)
+        client.get_all_tags()
+        client.get_all_categories()
+        client.search_commands(query="git")
+
+        # One session for schema setup, then one reused by every query
+        assert mock_driver.session.call_count == 2
+        mock_driver.session.assert_called_with(
+            database="test_db",
+            bookmark_manager=mock_graph_database.bookmark_manager.return_value,
+        )
+
+    @patch("lib.database.GraphDatabase")
+    def test_client_closes_session_when_thread_exits(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test that short-lived worker threads don't leave their sessions open."""
+        thread_session = Mock()
+        thread_session.execute_read.side_effect = lambda work, *args: work(thread_session, *args)
+        thread_session.run.return_value = []
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.side_effect = [mock_session, mock_session, thread_session]
+
+        client = Neo4jClient(mock_settings)
+        client.get_all_tags()
+        worker = threading.Thread(target=client.search_commands, kwargs={"query": "git"})
+        worker.start()
+        worker.join()
+
+        thread_session.close.assert_called_once()
+        mock_session.close.assert_not_called()
+
+        client.close()
+        mock_session.close.assert_called_once()
+        thread_session.close.assert_called_once()
 
     @patch("lib.database.GraphDatabase")
-    @patch("lib.database.uuid.uuid4")
+    @patch("lib.database.secrets.token_hex")
     def test_add_command(
         self,
-        mock_uuid: Mock,
+        mock_token_hex: Mock,
         mock_graph_database: Mock,
         mock_settings: Settings,
         mock_driver: Mock,
         mock_session: Mock,
     ) -> None:
         """Test adding a command to the database."""
-        mock_uuid.return_value = "test-uuid-123"
+        mock_token_hex.return_value = "test-id-123"
         mock_graph_database.driver.return_value = mock_driver
         mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = []
 
         client = Neo4jClient(mock_settings)
 
@@ -101,9 +242,83 @@ class TestNeo4jClient:
 
         command_id = client.add_command(cmd)
 
-        assert command_id == "test-uuid-123"
+        assert command_id == "test-id-123"
+        mock_token_hex.assert_called_once_with(16)
         mock_session.run.assert_called()
 
+    @patch("lib.database.GraphDatabase")
+    def test_add_commands_single_write(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test adding several commands stores them in one write transaction."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = []
+
+        client = Neo4jClient(mock_settings)
+        command_ids = client.add_commands(
+            [
+                Command(command="git status", description="Show status"),
+                Command(command="mysql -p secret", description="Connect"),
+            ]
+        )
+
+        assert len(command_ids) == 2
+        assert len(set(command_ids)) == 2
+        mock_session.execute_write.assert_called_once()
+        rows = mock_session.run.call_args[0][1]["rows"]
+        assert [row["id"] for row in rows] == command_ids
+        assert rows[1]["command"] == "mysql -p ****"
+        assert isinstance(rows[0]["created_at"], datetime)
+
+    @patch("lib.database.GraphDatabase")
+    def test_add_commands_dedupes_tags(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test duplicate tags are merged once and tagless batches skip the tag MERGE."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = []
+
+        client = Neo4jClient(mock_settings)
+        client.add_command(
+            Command(command="git status", description="Show status", tags=["git", "vcs", "git"])
+        )
+
+        query, params = mock_session.run.call_args[0]
+        assert params["rows"][0]["tags"] == ["git", "vcs"]
+        assert "MERGE (t:Tag" in query
+
+        client.add_command(Command(command="ls", description="List files"))
+
+        query = mock_session.run.call_args[0][0]
+        assert "Tag" not in query
+
+    @patch("lib.database.GraphDatabase")
+    def test_add_commands_empty(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test adding an empty batch does not touch the database."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+
+        client = Neo4jClient(mock_settings)
+
+        assert client.add_commands([]) == []
+        mock_session.execute_write.assert_not_called()
+
     @patch("lib.database.GraphDatabase")
     def test_search_commands_with_query(
         self,
@@ -117,26 +332,17 @@ class TestNeo4jClient:
         mock_driver.session.return_value = mock_session
 
         # Mock the query result
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "c": {
-                    "id": "test-id",
-                    "command": "git status",
-                    "description": "Show status",
-                    "os": "linux",
-                    "project_type": "python",
-                    "context": None,
-                    "category": "git",
-                    "created_at": "2023-01-01T00:00:00",
-                    "last_used": None,
-                    "use_count": 0,
-                },
-                "tags": ["git"],
-            }[key]
-        )
-
-        mock_session.run.return_value = [mock_record]
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id",
+                "git status",
+                "Show status",
+                tags=["git"],
+                os="linux",
+                project_type="python",
+                category="git",
+            )
+        ]
 
         client = Neo4jClient(mock_settings)
         commands = client.search_commands(query="status", limit=10)
@@ -145,6 +351,84 @@ class TestNeo4jClient:
         assert isinstance(commands[0], CommandWithMetadata)
         assert commands[0].command == "git status"
 
+    @patch("lib.database.GraphDatabase")
+    def test_search_commands_fuzzy(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test fuzzy search keeps typo matches and drops unrelated commands."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+
+        mock_session.run.return_value = [
+            make_command_record("git-id", "git status", "Show status"),
+            make_command_record("docker-id", "docker ps", "List containers"),
+        ]
+
+        client = Neo4jClient(mock_settings)
+        commands = client.search_commands(query="doker", fuzzy=True)
+
+        assert [cmd.id for cmd in commands] == ["docker-id"]
+
+    @patch("lib.database.GraphDatabase")
+    @patch("lib.database.SEARCH_TEXT_CACHE_SIZE", 2)
+    def test_search_commands_fuzzy_beyond_text_cache(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test fuzzy search stays correct when candidates outnumber the text cache."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        records = [
+            make_command_record("git-id", "git status", "Show status"),
+            make_command_record("docker-id", "docker ps", "List containers"),
+            make_command_record("kubectl-id", "kubectl get pods", "List pods"),
+        ]
+
+        client = Neo4jClient(mock_settings)
+        mock_session.run.return_value = records
+        assert [cmd.id for cmd in client.search_commands(query="doker", fuzzy=True)] == [
+            "docker-id"
+        ]
+
+        # Smaller candidate sets are cached, evicting the oldest entries to fit
+        mock_session.run.return_value = records[:2]
+        assert client.search_commands(query="kubctl", fuzzy=True) == []
+
+        mock_session.run.return_value = records[1:]
+        commands = client.search_commands(query="kubctl", fuzzy=True)
+        assert [cmd.id for cmd in commands] == ["kubectl-id"]
+
+    @patch("lib.database.GraphDatabase")
+    def test_search_commands_respects_limit(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test exact and fuzzy searches return at most `limit` commands in rank order."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [
+            make_command_record("busy-id", "docker ps", "List containers", use_count=5),
+            make_command_record("quiet-id", "docker ps -a", "List all containers"),
+            make_command_record("other-id", "docker images", "List images", use_count=9),
+        ]
+
+        client = Neo4jClient(mock_settings)
+        exact = client.search_commands(query="docker", limit=2)
+        fuzzy = client.search_commands(query="docker ps", fuzzy=True, limit=2)
+
+        assert [cmd.id for cmd in exact] == ["busy-id", "quiet-id"]
+        assert [cmd.id for cmd in fuzzy] == ["busy-id", "quiet-id"]
+
     @patch("lib.database.GraphDatabase")
     def test_search_commands_no_results(
         self,
@@ -175,26 +459,17 @@ class TestNeo4jClient:
         mock_graph_database.driver.return_value = mock_driver
         mock_driver.session.return_value = mock_session
 
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "c": {
-                    "id": "test-id",
-                    "command": "docker ps",
-                    "description": "List containers",
-                    "os": "linux",
-                    "project_type": None,
-                    "context": None,
-                    "category": "docker",
-                    "created_at": "2023-01-01T00:00:00",
-                    "last_used": None,
-                    "use_count": 1,
-                },
-                "tags": ["docker"],
-            }[key]
-        )
-
-        mock_session.run.return_value.single.return_value = mock_record
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id",
+                "docker ps",
+                "List containers",
+                tags=["docker"],
+                os="linux",
+                category="docker",
+                use_count=1,
+            )
+        ]
 
         client = Neo4jClient(mock_settings)
         cmd = client.get_command("test-id")
@@ -215,7 +490,7 @@ class TestNeo4jClient:
         """Test getting a command by ID when it doesn't exist."""
         mock_graph_database.driver.return_value = mock_driver
         mock_driver.session.return_value = mock_session
-        mock_session.run.return_value.single.return_value = None
+        mock_session.run.return_value = []
 
         client = Neo4jClient(mock_settings)
         cmd = client.get_command("nonexistent-id")
@@ -236,7 +511,7 @@ class TestNeo4jClient:
 
         mock_record = Mock()
         mock_record.__getitem__ = Mock(return_value=1)
-        mock_session.run.return_value.single.return_value = mock_record
+        mock_session.run.return_value = [mock_record]
 
         client = Neo4jClient(mock_settings)
         result = client.delete_command("test-id")
@@ -257,7 +532,7 @@ class TestNeo4jClient:
 
         mock_record = Mock()
         mock_record.__getitem__ = Mock(return_value=0)
-        mock_session.run.return_value.single.return_value = mock_record
+        mock_session.run.return_value = [mock_record]
 
         client = Neo4jClient(mock_settings)
         result = client.delete_command("nonexistent-id")
@@ -303,3 +578,306 @@ class TestNeo4jClient:
         categories = client.get_all_categories()
 
         assert categories == ["git", "docker", "kubernetes"]
+
+    @patch("lib.database.GraphDatabase")
+    def test_get_all_tags_cached_until_write(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test tag listings are served from cache until a command is added."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [{"tag": "git"}]
+
+        client = Neo4jClient(mock_settings)
+        assert client.get_all_tags() == ["git"]
+
+        mock_session.run.return_value = [{"tag": "docker"}, {"tag": "git"}]
+        assert client.get_all_tags() == ["git"]
+
+        client.add_command(Command(command="docker ps", description="List", tags=["docker"]))
+        assert client.get_all_tags() == ["docker", "git"]
+
+    @patch("lib.database.GraphDatabase")
+    @patch("lib.database.time.monotonic")
+    def test_get_command_served_from_cache(
+        self,
+        mock_monotonic: Mock,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test repeat lookups skip the database until the cached copy expires."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_monotonic.return_value = 0.0
+
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id", "docker ps", "List containers", tags=["docker"], use_count=3
+            )
+        ]
+
+        client = Neo4jClient(mock_settings)
+        first = client.get_command("test-id")
+        second = client.get_command("test-id")
+
+        assert first is not None
+        assert first.use_count == 4
+        assert first.last_used is not None
+        assert second is not None
+        assert second.command == "docker ps"
+        assert second.tags == ["docker"]
+        assert second.use_count == 5
+        mock_session.execute_read.assert_called_once()
+
+        # Callers get their own tags list, not the cached one
+        second.tags.append("mutated")
+        cached = client.get_command("test-id")
+        assert cached is not None
+        assert cached.tags == ["docker"]
+
+        # Once expired, another process's uses show up alongside unflushed ones
+        mock_monotonic.return_value = COMMAND_CACHE_TTL
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id", "docker ps", "List containers", tags=["docker"], use_count=5
+            )
+        ]
+        third = client.get_command("test-id")
+        assert third is not None
+        assert third.use_count == 9  # 5 stored + 3 not yet flushed + this use
+
+        # Deleted by another process: the refetch after expiry matches nothing
+        mock_monotonic.return_value = 2 * COMMAND_CACHE_TTL
+        mock_session.run.return_value = []
+        assert client.get_command("test-id") is None
+        client.close()
+
+    @patch("lib.database.GraphDatabase")
+    def test_use_counts_flushed_in_one_write(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test lookups don't write, and queued use counts are batched on close."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id", "git status", "Show status", created_at=datetime(2023, 1, 1, tzinfo=UTC)
+            )
+        ]
+
+        client = Neo4jClient(mock_settings)
+        for _ in range(3):
+            client.get_command("test-id")
+
+        mock_session.execute_write.assert_not_called()
+
+        client.close()
+
+        mock_session.execute_write.assert_called_once()
+        updates = mock_session.run.call_args[0][1]["updates"]
+        assert [(update["id"], update["count"]) for update in updates] == [("test-id", 3)]
+
+    @patch("lib.database.GraphDatabase")
+    @patch("lib.database.atexit")
+    def test_use_counts_flushed_at_exit(
+        self,
+        mock_atexit: Mock,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test queued use counts are written at exit when the client is never closed."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id", "git status", "Show status", created_at=datetime(2023, 1, 1, tzinfo=UTC)
+            )
+        ]
+
+        client = Neo4jClient(mock_settings)
+        client.get_command("test-id")
+        mock_atexit.register.assert_called_once()
+
+        at_exit = mock_atexit.register.call_args[0][0]
+        at_exit()
+
+        mock_session.execute_write.assert_called_once()
+        mock_atexit.unregister.assert_called_with(at_exit)
+        mock_driver.close.assert_called_once()
+
+    @patch("lib.database.GraphDatabase")
+    def test_get_command_does_not_wait_for_flush(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test lookups proceed during a flush and their uses are flushed afterwards."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id", "git status", "Show status", created_at=datetime(2023, 1, 1, tzinfo=UTC)
+            )
+        ]
+        write_started = threading.Event()
+        release_write = threading.Event()
+        write_done = threading.Event()
+
+        def blocking_write(work: Callable[..., object], *args: object) -> object:
+            write_started.set()
+            release_write.wait(timeout=5)
+            result = work(mock_session, *args)
+            write_done.set()
+            return result
+
+        mock_session.execute_write.side_effect = blocking_write
+
+        client = Neo4jClient(mock_settings)
+        client.get_command("test-id")
+
+        # Searching flushes queued use counts first
+        searcher = threading.Thread(target=client.search_commands)
+        searcher.start()
+        assert write_started.wait(timeout=5)
+
+        cmd = client.get_command("test-id")
+        assert not write_done.is_set()
+        release_write.set()
+        searcher.join()
+
+        assert cmd is not None
+        assert cmd.use_count == 2
+
+        client.close()
+        updates = mock_session.run.call_args[0][1]["updates"]
+        assert [(update["id"], update["count"]) for update in updates] == [("test-id", 1)]
+
+    @patch("lib.database.GraphDatabase")
+    @patch("lib.database.time.monotonic")
+    def test_get_command_miss_during_flush_counts_exactly(
+        self,
+        mock_monotonic: Mock,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test a refetch racing a flush of the same command counts its uses once."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_monotonic.return_value = 0.0
+        created_at = datetime(2023, 1, 1, tzinfo=UTC)
+        mock_session.run.return_value = [
+            make_command_record("test-id", "git status", "Show status", created_at=created_at)
+        ]
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def blocking_write(work: Callable[..., object], *args: object) -> object:
+            write_started.set()
+            release_write.wait(timeout=5)
+            result = work(mock_session, *args)
+            # The queued use is now stored
+            mock_session.run.return_value = [
+                make_command_record(
+                    "test-id", "git status", "Show status", created_at=created_at, use_count=1
+                )
+            ]
+            return result
+
+        mock_session.execute_write.side_effect = blocking_write
+
+        client = Neo4jClient(mock_settings)
+        client.get_command("test-id")
+        flusher = threading.Thread(target=client.search_commands)
+        flusher.start()
+        assert write_started.wait(timeout=5)
+
+        # The cached copy has expired, so this lookup must refetch mid-flush
+        mock_monotonic.return_value = COMMAND_CACHE_TTL
+        results: list[CommandWithMetadata | None] = []
+        getter = threading.Thread(target=lambda: results.append(client.get_command("test-id")))
+        getter.start()
+        getter.join(timeout=0.2)
+        assert getter.is_alive()  # Waiting for the flush of this command
+
+        release_write.set()
+        flusher.join()
+        getter.join()
+
+        assert results[0] is not None
+        assert results[0].use_count == 2
+        client.close()
+
+    @patch("lib.database.GraphDatabase")
+    def test_get_command_not_cached_when_deleted_during_fetch(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test a fetch that a delete overtakes doesn't leave the command cached."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [
+            make_command_record(
+                "test-id", "git status", "Show status", created_at=datetime(2023, 1, 1, tzinfo=UTC)
+            )
+        ]
+        client = Neo4jClient(mock_settings)
+        read = mock_session.execute_read.side_effect
+
+        def read_then_delete(work: Callable[..., object], *args: object) -> object:
+            result = read(work, *args)
+            mock_session.execute_read.side_effect = read
+            mock_session.run.return_value = [{"deleted": 1}]
+            client.delete_command("test-id")
+            mock_session.run.return_value = []
+            return result
+
+        mock_session.execute_read.side_effect = read_then_delete
+
+        assert client.get_command("test-id") is not None
+        assert client.get_command("test-id") is None
+
+    @patch("lib.database.GraphDatabase")
+    def test_get_all_tags_not_cached_when_written_during_fetch(
+        self,
+        mock_graph_database: Mock,
+        mock_settings: Settings,
+        mock_driver: Mock,
+        mock_session: Mock,
+    ) -> None:
+        """Test a listing fetched before a concurrent write isn't kept afterwards."""
+        mock_graph_database.driver.return_value = mock_driver
+        mock_driver.session.return_value = mock_session
+        mock_session.run.return_value = [{"tag": "git"}]
+        client = Neo4jClient(mock_settings)
+        read = mock_session.execute_read.side_effect
+
+        def read_then_write(work: Callable[..., object], *args: object) -> object:
+            result = read(work, *args)
+            mock_session.execute_read.side_effect = read
+            client.add_command(Command(command="docker ps", description="List", tags=["docker"]))
+            mock_session.run.return_value = [{"tag": "docker"}, {"tag": "git"}]
+            return result
+
+        mock_session.execute_read.side_effect = read_then_write
+
+        assert client.get_all_tags() == ["git"]
+        assert client.get_all_tags() == ["docker", "git"]
@@ -66,6 +66,12 @@ class TestCommand:
         assert data["description"] == "Install Node.js dependencies"
         assert data["tags"] == ["node", "npm"]
 
+    def test_command_is_immutable(self) -> None:
+        """Test that command fields can't be reassigned after creation."""
+        cmd = Command(command="git status", description="Show status")
+        with pytest.raises(ValidationError):
+            cmd.command = "git log"  # type: ignore[misc]
+
 
 class TestCommandWithMetadata:
     """Tests for CommandWithMetadata model."""